@@ -38,6 +38,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_config_entry_first_refresh()
     except Exception as err:
         _LOGGER.error("Error setting up DeskBike coordinator: %s", err)
+        # Stop the save timer and stop listener registered by async_setup
+        await coordinator.async_shutdown()
         return False
 
     # Store coordinator
@@ -55,7 +57,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove entry data
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            # Release the BLE connection so a reload can reconnect cleanly
+            await coordinator.async_shutdown()
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
 
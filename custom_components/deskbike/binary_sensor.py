@@ -8,9 +8,9 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -51,14 +51,7 @@ class DeskBikeBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{config_entry.data[CONF_ADDRESS]}_{description.key}"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.data[CONF_ADDRESS])},
-            name=config_entry.data[CONF_NAME],
-            manufacturer="DeskBike",
-            model=coordinator.device_info.get("model", "DeskBike"),
-            sw_version=coordinator.device_info.get("firmware_version"),
-            hw_version=coordinator.device_info.get("hardware_version"),
-        )
+        self._attr_device_info = coordinator.shared_device_info
 
     @property
     def is_on(self) -> bool | None:
@@ -4,9 +4,8 @@ from __future__ import annotations
 import logging
 from homeassistant.components.button import ButtonEntity, ButtonDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
@@ -35,14 +34,7 @@ class DeskBikeReconnectButton(ButtonEntity):
         self._attr_unique_id = f"{config_entry.data[CONF_ADDRESS]}_reconnect"
         self._attr_device_class = ButtonDeviceClass.RESTART
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.data[CONF_ADDRESS])},
-            name=config_entry.data[CONF_NAME],
-            manufacturer="DeskBike",
-            model=coordinator.device_info.get("model", "DeskBike"),
-            sw_version=coordinator.device_info.get("firmware_version"),
-            hw_version=coordinator.device_info.get("hardware_version"),
-        )
+        self._attr_device_info = coordinator.shared_device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -17,6 +17,12 @@ from .const import DEFAULT_NAME, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+DEVICE_NAME_PREFIX = "deskbike"
+
+def _is_deskbike(name: str | None) -> bool:
+    """Check if an advertised name starts with "deskbike" (case insensitive)."""
+    return bool(name) and name[:len(DEVICE_NAME_PREFIX)].lower() == DEVICE_NAME_PREFIX
+
 class DeskBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for DeskBike."""
 
@@ -32,8 +38,7 @@ class DeskBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle discovery via bluetooth."""
         _LOGGER.debug("Discovered BLE device: %s", discovery_info.name)
 
-        # Check if device name starts with "deskbike" (case insensitive)
-        if discovery_info.name and discovery_info.name.lower().startswith("deskbike"):
+        if _is_deskbike(discovery_info.name):
             await self.async_set_unique_id(discovery_info.address)
             self._abort_if_unique_id_configured()
 
@@ -60,13 +65,12 @@ class DeskBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         # Get all discovered Bluetooth devices
-        current_addresses = self._discovered_devices.keys()
+        # Skip known and already configured addresses before looking at the name
+        skip_addresses = set(self._discovered_devices) | self._async_current_ids(include_ignore=False)
         for discovery_info in async_discovered_service_info(self.hass):
-            if (
-                discovery_info.name
-                and discovery_info.name.lower().startswith("deskbike")
-                and discovery_info.address not in current_addresses
-            ):
+            if discovery_info.address in skip_addresses:
+                continue
+            if _is_deskbike(discovery_info.name):
                 self._discovered_devices[discovery_info.address] = discovery_info
 
         if not self._discovered_devices:
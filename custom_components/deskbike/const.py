@@ -5,9 +5,9 @@ DOMAIN: Final = "deskbike"
 DEFAULT_NAME: Final = "DeskBike"
 DEFAULT_WEIGHT: Final = 70.0  # Default weight in kg
 DEFAULT_RESISTANCE: Final = 75.0  # Default resistance level
+WHEEL_CIRCUMFERENCE: Final = 2.096  # Virtual wheel circumference in meters
 
 # BLE Characteristic UUIDs
-CHAR_PRODUCT_NAME: Final = "00002a00-0000-1000-8000-00805f9b34fb"
 CHAR_DEVICE_NAME: Final = "00002a00-0000-1000-8000-00805f9b34fb"
 CHAR_MODEL_NUMBER: Final = "00002a24-0000-1000-8000-00805f9b34fb"
 CHAR_SERIAL_NUMBER: Final = "00002a25-0000-1000-8000-00805f9b34fb"
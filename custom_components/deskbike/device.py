@@ -1,42 +0,0 @@
-"""DeskBike device representation."""
-from __future__ import annotations
-
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntityDescription,
-)
-from homeassistant.const import (
-    PERCENTAGE,
-    UnitOfLength,
-    UnitOfSpeed,
-)
-
-SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
-        key="speed",
-        name="Speed",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.SPEED,
-        icon="mdi:speedometer",
-    ),
-    SensorEntityDescription(
-        key="distance",
-        name="Distance",
-        native_unit_of_measurement=UnitOfLength.KILOMETERS,
-        device_class=SensorDeviceClass.DISTANCE,
-        icon="mdi:map-marker-distance",
-    ),
-    SensorEntityDescription(
-        key="cadence",
-        name="Cadence",
-        native_unit_of_measurement="rpm",
-        icon="mdi:rotate-right",
-    ),
-    SensorEntityDescription(
-        key="battery",
-        name="Battery",
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=SensorDeviceClass.BATTERY,
-        icon="mdi:battery",
-    ),
-)
@@ -6,9 +6,9 @@ from homeassistant.components.number import (
     RestoreNumber,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfMass, CONF_NAME, CONF_ADDRESS
+from homeassistant.const import UnitOfMass, CONF_ADDRESS
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, DEFAULT_WEIGHT, DEFAULT_RESISTANCE
@@ -45,28 +45,20 @@ class DeskBikeWeightSetting(RestoreNumber):
         self._attr_entity_category = EntityCategory.CONFIG
         self._attr_icon = "mdi:weight"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.data[CONF_ADDRESS])},
-            name=entry.data[CONF_NAME],
-            manufacturer="DeskBike",
-            model=coordinator.device_info.get("model", "DeskBike"),
-            sw_version=coordinator.device_info.get("firmware_version"),
-            hw_version=coordinator.device_info.get("hardware_version"),
-        )
+        self._attr_device_info = coordinator.shared_device_info
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
 
         # Restore previous state
-        if last_state := await self.async_get_last_state():
-            try:
-                restored_value = float(last_state.state)
-                self.coordinator.weight = restored_value
-                _LOGGER.debug("Restored weight value: %s", restored_value)
-            except (ValueError, TypeError):
-                self.coordinator.weight = DEFAULT_WEIGHT
-                _LOGGER.debug("Using default weight: %s", DEFAULT_WEIGHT)
+        last_number_data = await self.async_get_last_number_data()
+        if last_number_data is not None and last_number_data.native_value is not None:
+            self.coordinator.weight = float(last_number_data.native_value)
+            _LOGGER.debug("Restored weight value: %s", self.coordinator.weight)
+        else:
+            self.coordinator.weight = DEFAULT_WEIGHT
+            _LOGGER.debug("Using default weight: %s", DEFAULT_WEIGHT)
 
     @property
     def native_value(self) -> float:
@@ -75,6 +67,8 @@ class DeskBikeWeightSetting(RestoreNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current weight setting."""
+        if value == self.coordinator.weight:
+            return
         self.coordinator.weight = value
         self.async_write_ha_state()
 
@@ -96,27 +90,19 @@ class DeskBikeResistanceSetting(RestoreNumber):
         self._attr_name = "Resistance"
         self._attr_entity_category = EntityCategory.CONFIG
         self._attr_icon = "mdi:gauge"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.data[CONF_ADDRESS])},
-            name=entry.data[CONF_NAME],
-            manufacturer="DeskBike",
-            model=coordinator.device_info.get("model", "DeskBike"),
-            sw_version=coordinator.device_info.get("firmware_version"),
-            hw_version=coordinator.device_info.get("hardware_version"),
-        )
+        self._attr_device_info = coordinator.shared_device_info
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         # Restore previous state
-        if last_state := await self.async_get_last_state():
-            try:
-                restored_value = float(last_state.state)
-                self.coordinator.resistance = restored_value
-                _LOGGER.debug("Restored resistance value: %s", restored_value)
-            except (ValueError, TypeError):
-                self.coordinator.resistance = DEFAULT_RESISTANCE
-                _LOGGER.debug("Using default resistance: %s", DEFAULT_RESISTANCE)
+        last_number_data = await self.async_get_last_number_data()
+        if last_number_data is not None and last_number_data.native_value is not None:
+            self.coordinator.resistance = float(last_number_data.native_value)
+            _LOGGER.debug("Restored resistance value: %s", self.coordinator.resistance)
+        else:
+            self.coordinator.resistance = DEFAULT_RESISTANCE
+            _LOGGER.debug("Using default resistance: %s", DEFAULT_RESISTANCE)
 
     @property
     def native_value(self) -> float:
@@ -125,5 +111,7 @@ class DeskBikeResistanceSetting(RestoreNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current resistance setting."""
+        if value == self.coordinator.resistance:
+            return
         self.coordinator.resistance = value
         self.async_write_ha_state()
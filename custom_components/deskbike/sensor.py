@@ -2,12 +2,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import struct
+import time
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from bleak import BleakClient
+from bleak_retry_connector import (
+    BleakClientWithServiceCache,
+    BleakNotFoundError,
+    establish_connection,
+)
+from homeassistant.components.bluetooth import async_ble_device_from_address
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
@@ -17,14 +27,15 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_ADDRESS,
-    CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
     PERCENTAGE,
     UnitOfLength,
     UnitOfSpeed,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -34,7 +45,6 @@ from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    CHAR_PRODUCT_NAME,
     CHAR_DEVICE_NAME,
     CHAR_MODEL_NUMBER,
     CHAR_SERIAL_NUMBER,
@@ -45,6 +55,7 @@ from .const import (
     CHAR_CSC_MEASUREMENT,
     DEFAULT_WEIGHT,
     DEFAULT_RESISTANCE,
+    WHEEL_CIRCUMFERENCE,
     MET_LIGHT,
     MET_MODERATE,
     MET_VIGOROUS,
@@ -54,6 +65,37 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# CSC measurement layouts: cumulative revolutions + last event time (1/1024 s)
+_CSC_WHEEL = struct.Struct("<LH")
+_CSC_CRANK = struct.Struct("<HH")
+
+# Device Information characteristics, the device_info key they are stored under
+# and the name of the diagnostic sensor showing them
+_DEVICE_INFO_CHARS = (
+    (CHAR_MODEL_NUMBER, "model", "Model Number"),
+    (CHAR_SERIAL_NUMBER, "serial_number", "Serial Number"),
+    (CHAR_FIRMWARE, "firmware_version", "Firmware Version"),
+    (CHAR_HARDWARE, "hardware_version", "Hardware Version"),
+    (CHAR_SOFTWARE, "software_version", "Software Version"),
+)
+
+# Device information is re-read from the bike once it is older than this
+_DEVICE_INFO_TTL = timedelta(days=7)
+
+# Seconds to wait before each reconnect attempt after an unexpected disconnect
+_RECONNECT_BACKOFF = (0, 1, 2, 4, 8)
+
+# Seconds to collect notifications before the entities are updated
+_UPDATE_COALESCE_DELAY = 0.5
+
+# MET per speed band, a speed below _MET_SPEED_THRESHOLDS[i] (km/h) uses _MET_VALUES[i]
+_MET_SPEED_THRESHOLDS = (16.0, 19.0, 22.5, 25.7)  # 10, 12, 14 and 16 mph
+_MET_VALUES = (MET_LIGHT, MET_MODERATE, MET_VIGOROUS, MET_VERY_VIGOROUS, MET_RACING)
+
+# Sensors restored from their last state, and sensors shown as d.HH:mm:ss
+_RESTORE_KEYS = frozenset({"distance", "total_active_time", "total_calories", "total_crank_rotations"})
+_TIME_FORMAT_KEYS = frozenset({"daily_active_time", "total_active_time"})
+
 SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
         key="speed",
@@ -144,27 +186,33 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+@lru_cache(maxsize=4)
 def format_seconds_to_time(seconds: int) -> str:
     """Format seconds to d.HH:mm:ss format."""
     if seconds is None:
         return None
 
-    days = seconds // (24 * 3600)
-    remaining = seconds % (24 * 3600)
-    hours = remaining // 3600
-    remaining %= 3600
-    minutes = remaining // 60
-    remaining %= 60
+    days, remaining = divmod(seconds, 24 * 3600)
+    hours, remaining = divmod(remaining, 3600)
+    minutes, remaining = divmod(remaining, 60)
 
     if days > 0:
-        result = f"{days}.{hours:02d}:{minutes:02d}:{remaining:02d}"
-    else:
-        result = f"{hours:02d}:{minutes:02d}:{remaining:02d}"
-    return result
+        return f"{days}.{hours:02d}:{minutes:02d}:{remaining:02d}"
+    return f"{hours:02d}:{minutes:02d}:{remaining:02d}"
 
 class DeskBikeSensor(CoordinatorEntity, RestoreSensor):
     """Representation of a DeskBike sensor."""
 
+    # Number of decimals per sensor key, other values are returned unrounded
+    _ROUND_DIGITS = {
+        "daily_distance": 2,
+        "distance": 1,
+        "speed": 1,
+        "cadence": 1,
+        "daily_calories": 1,
+        "total_calories": 1,
+    }
+
     def __init__(
         self,
         coordinator: DeskBikeDataUpdateCoordinator,
@@ -178,15 +226,8 @@ class DeskBikeSensor(CoordinatorEntity, RestoreSensor):
         self._config_entry = config_entry
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{config_entry.data[CONF_ADDRESS]}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.data[CONF_ADDRESS])},
-            name=config_entry.data[CONF_NAME],
-            manufacturer="DeskBike",
-            model=coordinator.device_info.get("model", "DeskBike"),
-            sw_version=coordinator.device_info.get("firmware_version"),
-            hw_version=coordinator.device_info.get("hardware_version"),
-            connections={("bluetooth", config_entry.data[CONF_ADDRESS])},
-        )
+        self._attr_device_info = coordinator.shared_device_info
+        self._round_digits = self._ROUND_DIGITS.get(description.key)
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -195,12 +236,7 @@ class DeskBikeSensor(CoordinatorEntity, RestoreSensor):
         # Restore previous state for total/cumulative sensors
         if (last_state := await self.async_get_last_state()) is not None:
             # Only restore certain sensors that should persist
-            if self.entity_description.key in [
-                "distance",
-                "total_active_time",
-                "total_calories",
-                "total_crank_rotations",
-            ]:
+            if self.entity_description.key in _RESTORE_KEYS:
                 try:
                     if last_state.state not in (None, "unknown", "unavailable"):
                         self.coordinator._data[self.entity_description.key] = float(last_state.state)
@@ -223,29 +259,19 @@ class DeskBikeSensor(CoordinatorEntity, RestoreSensor):
             return None
 
         value = self.coordinator.data.get(self.entity_description.key)
-        if value is not None:
-
-            if isinstance(value, (int, float)):
-                if self.entity_description.key in ["daily_distance"]:
-                    return round(value, 2)
-                elif self.entity_description.key in ["distance"]:
-                    return round(value, 1)
-                elif self.entity_description.key in ["speed", "cadence"]:
-                    return round(value, 1)
-                elif self.entity_description.key in ["daily_calories", "total_calories"]:
-                    return round(value, 1)
-
-                return value
-            return value
-        return None
+        if value is not None and self._round_digits is not None and isinstance(value, (int, float)):
+            return round(value, self._round_digits)
+        return value
 
     @property
     def state(self) -> str | None:
         """Return the state of the sensor."""
-        if self.entity_description.key in ["daily_active_time", "total_active_time"]:
-            if self.native_value is not None:
-                return format_seconds_to_time(int(self.native_value))
-        return str(self.native_value) if self.native_value is not None else None
+        value = self.native_value
+        if value is None:
+            return None
+        if self.entity_description.key in _TIME_FORMAT_KEYS:
+            return format_seconds_to_time(int(value))
+        return str(value)
 
 class DeskBikeDiagnosticSensor(DeskBikeSensor):
     """Representation of a DeskBike diagnostic sensor."""
@@ -275,6 +301,28 @@ class DeskBikeDiagnosticSensor(DeskBikeSensor):
         """Return the state of the sensor."""
         return self._value
 
+def _build_diagnostic_entities(
+    coordinator: DeskBikeDataUpdateCoordinator,
+    config_entry: ConfigEntry,
+    device_info: dict[str, str],
+) -> list[DeskBikeDiagnosticSensor]:
+    """Create diagnostic sensors for device info values that have no sensor yet."""
+    entities = []
+    for _, info_key, char_name in _DEVICE_INFO_CHARS:
+        if info_key in coordinator._diagnostic_keys_added:
+            continue
+        if value := device_info.get(info_key):
+            coordinator._diagnostic_keys_added.add(info_key)
+            entities.append(
+                DeskBikeDiagnosticSensor(
+                    coordinator,
+                    config_entry,
+                    char_name,
+                    value
+                )
+            )
+    return entities
+
 class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching DeskBike data."""
 
@@ -296,21 +344,51 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
         self._weight = DEFAULT_WEIGHT
         self._resistance = DEFAULT_RESISTANCE
         self._client: BleakClient | None = None
+        self._chars = {}
         self._connected = False
         self.device_info = {}
-        self._last_wheel_rev = 0
-        self._last_wheel_event = 0
-        self._last_crank_rev = 0
-        self._last_crank_event = 0
-        self._wheel_circumference = 2.096
-        self._last_activity_check = None
+        self._device_info_read_at: datetime | None = None  # Last complete device info read (UTC)
+        self._shared_device_info: DeviceInfo | None = None
+        self._diagnostic_keys_added: set[str] = set()  # device_info keys with a diagnostic sensor
+        self._last_wheel = (0, 0)  # (cumulative revolutions, last event time)
+        self._last_crank = (0, 0)  # (cumulative revolutions, last event time)
+        self._wheel_circumference = WHEEL_CIRCUMFERENCE
+        self._last_activity_check = None  # time.monotonic() of the last activity check
         self._last_active = None
         self._activity_start_time = None
         self._reconnect_task = None
-        self._last_connection_attempt = None
-        self._retry_interval = timedelta(minutes=1)
+        self._reload_task = None
+        self._shutting_down = False  # Set by async_shutdown, no new reconnects after that
+        self._update_handle: asyncio.TimerHandle | None = None
+        self._last_connection_attempt = None  # time.monotonic() of the last connection attempt
+        self._retry_interval = 60.0  # seconds
         self._connection_lock = asyncio.Lock()
         self._force_reconnect = False  # Add this flag
+        self._last_activity_time = None  # time.monotonic() of the last notification
+        self._activity_timeout = 300.0  # seconds
+        self._connection_attempts = 0
+        self._max_connection_attempts = 3
+        self._connection_cooldown = 600.0  # seconds to wait after max attempts before trying again
+        self._daily_reset_time = dt_util.start_of_local_day()
+        self._last_save = None  # time.monotonic() of the last persistent save
+        self._save_min_interval = 30.0  # seconds between saves of pending changes
+        self._save_interval = 300.0  # seconds between periodic saves
+        self._unsub_save_timer = None
+
+        # Stores are reused for every load and save
+        self._persistent_store = Store(
+            hass=hass,
+            version=1,
+            key=f"{DOMAIN}_persistent_data_{address}",
+            private=True,
+            atomic_writes=True,
+        )
+        self._sensor_values_store = Store(hass, 1, f"{DOMAIN}_sensor_values_{address}")
+        self._unsub_stop = None
+
+        # Set by the sensor platform, used to add diagnostic sensors later on
+        self._config_entry: ConfigEntry | None = None
+        self.async_add_entities: AddEntitiesCallback | None = None
 
         # Define sensors
         self._daily_sensors = [
@@ -345,12 +423,11 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
             "total_crank_rotations": 0,
         }
 
-        self._last_saved_daily_values = None
+        self._save_pending = False
+        self._fully_initialized = False  # Set once async_setup has filled in all saved values
 
     def _should_attempt_connection(self) -> bool:
         """Determine if connection attempt should be made."""
-        now = dt_util.utcnow()
-
         # Always attempt if forced reconnect is set
         if self._force_reconnect:
             self._force_reconnect = False  # Reset flag
@@ -362,12 +439,19 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
             return False
 
         # If we have recent activity, attempt connection
-        if self._last_activity_time and (now - self._last_activity_time) < self._activity_timeout:
+        if (self._last_activity_time is not None and
+            time.monotonic() - self._last_activity_time < self._activity_timeout):
             return True
 
-        # If we haven't exceeded max attempts, try anyway
+        # After max attempts, start over once the cool-down since the last attempt has passed,
+        # the bike is idle most of the time and may only be asleep or out of range
+        if (self._connection_attempts >= self._max_connection_attempts and
+            self._last_connection_attempt is not None and
+            time.monotonic() - self._last_connection_attempt >= self._connection_cooldown):
+            self._connection_attempts = 0
+
+        # If we haven't exceeded max attempts, try anyway (_async_connect counts the attempts)
         if self._connection_attempts < self._max_connection_attempts:
-            self._connection_attempts += 1
             return True
 
         # Otherwise, don't attempt connection
@@ -377,7 +461,7 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
         """Save persistent sensor values including daily values."""
         try:
             # Don't save if we haven't properly initialized yet
-            if any(self._data[key] is None for key in self._daily_sensors + self._persistent_sensors):
+            if not self._fully_initialized:
                 _LOGGER.debug("Skipping save as not all values are initialized yet")
                 return
 
@@ -402,6 +486,11 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
             for key in self._persistent_sensors:
                 persistent_data[key] = self._data[key]
 
+            # Keep device info so it is not read again after every restart
+            if self._device_info_read_at is not None:
+                persistent_data["device_info"] = dict(self.device_info)
+                persistent_data["device_info_read_at"] = self._device_info_read_at.isoformat()
+
             _LOGGER.debug(
                 "Saving persistent data - Daily values: %s, Date: %s, Reset time: %s",
                 daily_data,
@@ -409,27 +498,14 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
                 self._daily_reset_time.isoformat()
             )
 
-            store = Store(
-                hass=self.hass,
-                version=1,
-                key=f"{DOMAIN}_persistent_data_{self.address}",
-                private=True,
-                atomic_writes=True,
-            )
-            await store.async_save(persistent_data)
+            await self._persistent_store.async_save(persistent_data)
         except Exception as err:
             _LOGGER.error("Error saving persistent data: %s", err)
 
     async def _restore_persistent_data(self) -> None:
         """Restore persistent sensor values including daily values."""
         try:
-            store = Store(
-                hass=self.hass,
-                version=1,
-                key=f"{DOMAIN}_persistent_data_{self.address}",
-                private=True
-            )
-            stored_data = await store.async_load()
+            stored_data = await self._persistent_store.async_load()
 
             _LOGGER.debug("Loaded stored data: %s", stored_data)
 
@@ -465,10 +541,19 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
                             self._data[key] = 0.0
                             _LOGGER.debug("Reset daily value %s to 0", key)
 
+                # Restore device info, it is read again once older than _DEVICE_INFO_TTL
+                if "device_info" in stored_data and "device_info_read_at" in stored_data:
+                    try:
+                        self._device_info_read_at = datetime.fromisoformat(stored_data["device_info_read_at"])
+                        self.device_info.update(stored_data["device_info"])
+                        self._shared_device_info = None
+                    except ValueError as err:
+                        _LOGGER.debug("Error parsing stored device info time: %s", err)
+
                 # Restore last reset time
                 if "last_daily_reset" in stored_data:
                     try:
-                        self._daily_reset_time = dt_util.parse_datetime(stored_data["last_daily_reset"])
+                        self._daily_reset_time = datetime.fromisoformat(stored_data["last_daily_reset"])
                         _LOGGER.debug("Restored daily reset time: %s", self._daily_reset_time)
                     except Exception as err:
                         _LOGGER.error("Error parsing stored reset time: %s", err)
@@ -483,9 +568,10 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
                 for key in self._daily_sensors:
                     self._data[key] = 0.0
 
-            _LOGGER.debug("Final data after restore: %s", {
-                key: self._data[key] for key in self._daily_sensors
-            })
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Final data after restore: %s", {
+                    key: self._data[key] for key in self._daily_sensors
+                })
 
         except Exception as err:
             _LOGGER.error("Error restoring persistent data: %s", err)
@@ -510,6 +596,21 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
         """Set the current resistance setting."""
         self._resistance = value
 
+    @property
+    def shared_device_info(self) -> DeviceInfo:
+        """Get the device registry info shared by all DeskBike entities."""
+        if self._shared_device_info is None:
+            self._shared_device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.address)},
+                name=self.name,
+                manufacturer="DeskBike",
+                model=self.device_info.get("model", "DeskBike"),
+                sw_version=self.device_info.get("firmware_version"),
+                hw_version=self.device_info.get("hardware_version"),
+                connections={("bluetooth", self.address)},
+            )
+        return self._shared_device_info
+
     def _calculate_calories(self, speed: float, time_diff: float, resistance: int) -> float:
         """Calculate calories burned based on speed and time.
 
@@ -520,33 +621,20 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
         Returns:
             Calories burned in kcal
         """
-        # Convert time from seconds to hours
-        hours = time_diff / 3600
-
         # Select MET based on speed
-        if speed < 16:  # 10 mph
-            met = MET_LIGHT
-        elif speed < 19:  # 12 mph
-            met = MET_MODERATE
-        elif speed < 22.5:  # 14 mph
-            met = MET_VIGOROUS
-        elif speed < 25.7:  # 16 mph
-            met = MET_VERY_VIGOROUS
-        else:
-            met = MET_RACING
+        met = _MET_VALUES[bisect_right(_MET_SPEED_THRESHOLDS, speed)]
 
         # Calculate calories: MET * weight * time(hours) * resistance %
-        return met * self.weight * hours * resistance / 100
+        return met * self.weight * time_diff * resistance / 360000
 
-    def _check_activity_timeout(self) -> None:
+    def _check_activity_timeout(self, now: float) -> None:
         """Check if device is inactive and reset speed if needed."""
-        now = dt_util.now()
         if self._last_activity_check is None:
             self._last_activity_check = now
             return
 
         # If no activity for 3 seconds, set speed and status to 0
-        if (now - self._last_activity_check).total_seconds() > 3:
+        if now - self._last_activity_check > 3:
             self._data["speed"] = 0.0
             self._data["cadence"] = 0.0
             self._data["is_active"] = False
@@ -554,56 +642,75 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
             # Just reset the activity start time
             self._activity_start_time = None
 
-    def _check_daily_reset(self) -> None:
-        """Check if we need to reset daily values."""
-        now = dt_util.now()
+    def _check_daily_reset(self, now: datetime) -> bool:
+        """Check if we need to reset daily values, return True if they were reset."""
         _LOGGER.debug(
             "Checking daily reset - Current time: %s, Last reset: %s",
             now,
             self._daily_reset_time
         )
 
-        if now > self._daily_reset_time + timedelta(days=1):
-            _LOGGER.debug(
-                "Performing daily reset. Old values: %s",
-                {key: self._data[key] for key in self._daily_sensors}
-            )
+        # A new local day has started since the last reset
+        if now.date() != self._daily_reset_time.date():
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Performing daily reset. Old values: %s",
+                    {key: self._data[key] for key in self._daily_sensors}
+                )
             for key in self._daily_sensors:
                 self._data[key] = 0.0
             self._daily_reset_time = dt_util.start_of_local_day()
-            # Save the reset state
-            asyncio.create_task(self._save_persistent_data())
+            # Save the reset state with the next save tick
+            self._save_pending = True
             _LOGGER.debug("Daily values reset completed")
+            return True
+        return False
 
     async def _reload_sensor_values(self):
         """Reload sensor values."""
         try:
-            battery_bytes = await self._client.read_gatt_char(CHAR_BATTERY)
-            self._data["battery"] = int.from_bytes(battery_bytes, byteorder='little')
-
-            for char_uuid, key in [
-                (CHAR_MODEL_NUMBER, "model"),
-                (CHAR_SERIAL_NUMBER, "serial_number"),
-                (CHAR_FIRMWARE, "firmware_version"),
-                (CHAR_HARDWARE, "hardware_version"),
-                (CHAR_SOFTWARE, "software_version"),
-            ]:
-                value = await self._client.read_gatt_char(char_uuid)
+            # Device info does not change, so only read the characteristics still missing
+            device_chars = [
+                (char_uuid, key)
+                for char_uuid, key, _ in _DEVICE_INFO_CHARS
+                if not self.device_info.get(key)
+            ]
+
+            battery_bytes, *values = await self._read_chars(
+                (CHAR_BATTERY, *(char_uuid for char_uuid, _ in device_chars))
+            )
+            if battery_bytes is not None:
+                self._data["battery"] = battery_bytes[0] if battery_bytes else 0
+
+            read_any = False
+            for (_, key), value in zip(device_chars, values):
+                if value is None:
+                    continue
                 self.device_info[key] = value.decode('utf-8').strip()
                 self._data[key] = self.device_info[key]
+                read_any = True
+            self.async_set_updated_data(self._data)
 
-            self.async_set_updated_data(self._data.copy())
-
-            # Dynamically add sensors if they were unavailable during setup
-            await self._add_missing_sensors()
+            if read_any:
+                self._shared_device_info = None
+                # Dynamically add sensors if they were unavailable during setup
+                await self._add_missing_sensors()
         except Exception as e:
             _LOGGER.debug("Error reloading sensor values: %s", e)
 
     def _notification_handler(self, _: int, data: bytearray) -> None:
         """Handle incoming CSC measurement notifications."""
+        if not data:
+            return
+
         try:
-            # Update activity timestamp when we receive data
-            self._last_activity_time = dt_util.utcnow()
+            # Interval math uses the monotonic clock, wall time is only read for activity
+            now_mono = time.monotonic()
+            self._last_activity_time = now_mono
+
+            # Bind hot lookups to locals, the handler runs for every notification
+            values = self._data
+            was_active = values["is_active"]
 
             flags = data[0]
             wheel_rev_present = bool(flags & 0x01)
@@ -611,119 +718,125 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
             offset = 1
 
             activity_detected = False
-            now = dt_util.now()
 
             if wheel_rev_present:
-                wheel_revs, wheel_event = struct.unpack_from("<LH", data, offset)
-                if self._last_wheel_event != 0:
-                    wheel_event_diff = (wheel_event - self._last_wheel_event) & 0xFFFF
+                wheel_revs, wheel_event = _CSC_WHEEL.unpack_from(data, offset)
+                last_wheel_rev, last_wheel_event = self._last_wheel
+                if last_wheel_event != 0:
+                    wheel_event_diff = (wheel_event - last_wheel_event) & 0xFFFF
                     if wheel_event_diff > 0:
                         # Calculate time difference
                         time_diff = wheel_event_diff / 1024.0
 
-                        # Handle wheel revolution counter wrapping
-                        if wheel_revs >= self._last_wheel_rev:
-                            wheel_rev_diff  = wheel_revs - self._last_wheel_rev
-                        else:
-                            # Counter wrapped around (uint32 max = 4294967295)
-                            wheel_rev_diff  = (4294967295 - self._last_wheel_rev) + wheel_revs + 1
+                        # Calculate revolution difference, masking handles uint32 wrap-around
+                        wheel_rev_diff = (wheel_revs - last_wheel_rev) & 0xFFFFFFFF
 
-                        # Sanity check: If wheel_rev_diff  is unreasonably large, ignore this update
-                        if wheel_rev_diff  > 1000:  # More than 1000 revolutions in one update is unlikely
+                        # Sanity check: If wheel_rev_diff is unreasonably large, ignore this update
+                        if wheel_rev_diff > 1000:  # More than 1000 revolutions in one update is unlikely
                             _LOGGER.warning(
                                 "Ignoring suspicious wheel revolution difference: %d (previous: %d, current: %d)",
-                                wheel_rev_diff , self._last_wheel_rev, wheel_revs
+                                wheel_rev_diff, last_wheel_rev, wheel_revs
                             )
-                            self._last_wheel_rev = wheel_revs
-                            self._last_wheel_event = wheel_event
+                            self._last_wheel = (wheel_revs, wheel_event)
                             return
                         else:
-                            distance = wheel_rev_diff  * self._wheel_circumference # in meters
+                            distance = wheel_rev_diff * self._wheel_circumference # in meters
                             speed = (distance / time_diff) * 3.6
 
                             # Update sensors if speed is reasonable
                             if 0 <= speed <= 100:  # Reasonable speed range for a bike
-                                self._data["speed"] = round(speed, 1)
-                                distance_km = distance / 1000
-                                self._data["distance"] += distance_km
-                                self._data["daily_distance"] += distance_km
+                                values["speed"] = speed
+                                distance_km = distance * 0.001
+                                values["distance"] += distance_km
+                                values["daily_distance"] += distance_km
                                 activity_detected = True
 
-                self._last_wheel_rev = wheel_revs
-                self._last_wheel_event = wheel_event
-                offset += 6
+                self._last_wheel = (wheel_revs, wheel_event)
+                offset += _CSC_WHEEL.size
 
             if crank_rev_present:
-                crank_revs, crank_event = struct.unpack_from("<HH", data, offset)
-                if self._last_crank_event != 0:
-                    crank_event_diff = (crank_event - self._last_crank_event) & 0xFFFF
+                crank_revs, crank_event = _CSC_CRANK.unpack_from(data, offset)
+                last_crank_rev, last_crank_event = self._last_crank
+                if last_crank_event != 0:
+                    crank_event_diff = (crank_event - last_crank_event) & 0xFFFF
                     if crank_event_diff > 0:
-                        # Calculate revolution difference
-                        if crank_revs >= self._last_crank_rev:
-                            crank_rev_diff = crank_revs - self._last_crank_rev
-                        else:
-                            # Handle counter wrap-around (uint16 max = 65535)
-                            crank_rev_diff = (65535 - self._last_crank_rev) + crank_revs + 1
+                        # Calculate revolution difference, masking handles uint16 wrap-around
+                        crank_rev_diff = (crank_revs - last_crank_rev) & 0xFFFF
 
                         # Update rotation counters if the difference is reasonable
                         if crank_rev_diff < 100:  # Sanity check: limit to 100 revolutions per update
-                            self._data["daily_crank_rotations"] += crank_rev_diff
-                            self._data["total_crank_rotations"] += crank_rev_diff
+                            values["daily_crank_rotations"] += crank_rev_diff
+                            values["total_crank_rotations"] += crank_rev_diff
                         else:
                             _LOGGER.warning(
                                 "Ignoring suspicious crank revolution difference: %d (previous: %d, current: %d)",
-                                crank_rev_diff, self._last_crank_rev, crank_revs
+                                crank_rev_diff, last_crank_rev, crank_revs
                             )
 
                         time_diff = crank_event_diff / 1024.0
                         cadence = (crank_rev_diff / time_diff) * 60
-                        self._data["cadence"] = round(cadence, 1)
+                        values["cadence"] = cadence
                         if cadence > 0:
                             activity_detected = True
 
-                self._last_crank_rev = crank_revs
-                self._last_crank_event = crank_event
+                self._last_crank = (crank_revs, crank_event)
 
             # Update activity status and timing
             if activity_detected:
+                now = dt_util.now()
+                # Start a new day before counting this activity into it
+                self._check_daily_reset(now)
                 self._last_active = now
-                self._data["last_active"] = self._last_active
+                values["last_active"] = self._last_active
 
-                if not self._data["is_active"]:
-                    self._data["is_active"] = True
-                    # Reload sensor values when activity starts
-                    asyncio.create_task(self._reload_sensor_values())
+                if not values["is_active"]:
+                    values["is_active"] = True
+                    # Reload sensor values when activity starts, unless a reload is still running
+                    if not self._shutting_down and (self._reload_task is None or self._reload_task.done()):
+                        self._reload_task = asyncio.create_task(self._reload_sensor_values())
 
                 # Start or update activity timing
                 if self._activity_start_time is None:
-                    self._activity_start_time = now
+                    self._activity_start_time = now_mono
                 else:
                     # Calculate time difference since last activity check
-                    time_diff = (now - self._last_activity_check).total_seconds()
-                    self._data["daily_active_time"] += time_diff
-                    self._data["total_active_time"] += time_diff
+                    time_diff = now_mono - self._last_activity_check
+                    values["daily_active_time"] += time_diff
+                    values["total_active_time"] += time_diff
 
-                self._last_activity_check = now
+                self._last_activity_check = now_mono
 
                 # Calculate and add calories if speed is available
-                if self._data["speed"] > 0:
+                if values["speed"] > 0:
                     resistance = self._resistance  # Assuming resistance is stored in the coordinator
-                    calories_burned = self._calculate_calories(self._data["speed"], 1, resistance)  # 1 second of activity
-                    self._data["daily_calories"] += calories_burned
-                    self._data["total_calories"] += calories_burned
-            else:
-                self._check_activity_timeout()
-
-            self._check_daily_reset()
-            self.async_set_updated_data(self._data.copy())
+                    calories_burned = self._calculate_calories(values["speed"], 1, resistance)  # 1 second of activity
+                    values["daily_calories"] += calories_burned
+                    values["total_calories"] += calories_burned
 
-            # Save current state periodically if values changed
-            if self._data != self._last_saved_daily_values:
-                self._last_saved_daily_values = self._data.copy()
-                asyncio.create_task(self._save_persistent_data())
+                # Counters changed, the next coordinator refresh saves them in one go
+                self._save_pending = True
+            else:
+                self._check_activity_timeout(now_mono)
+
+            if values["is_active"] != was_active:
+                # Show activity starting or stopping right away
+                self._flush_update()
+            elif self._update_handle is None:
+                self._update_handle = self.hass.loop.call_later(
+                    _UPDATE_COALESCE_DELAY, self._flush_update
+                )
         except Exception as e:
             _LOGGER.error("Error processing CSC notification: %s", e)
 
+    @callback
+    def _flush_update(self) -> None:
+        """Push the collected notification data to the entities."""
+        if self._update_handle is not None:
+            self._update_handle.cancel()
+            self._update_handle = None
+        # Entities only read coordinator.data, so hand over the live dict instead of a copy
+        self.async_set_updated_data(self._data)
+
     async def force_reconnect(self) -> None:
         """Force a reconnection attempt."""
         _LOGGER.debug("Forcing reconnection to DeskBike")
@@ -752,13 +865,11 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _save_sensor_values(self):
         """Save sensor values to Home Assistant storage."""
-        store = Store(self.hass, 1, f"{DOMAIN}_sensor_values_{self.address}")
-        await store.async_save(self._data)
+        await self._sensor_values_store.async_save(self._data)
 
     async def _restore_sensor_values(self):
         """Restore sensor values from Home Assistant storage."""
-        store = Store(self.hass, 1, f"{DOMAIN}_sensor_values_{self.address}")
-        restored_data = await store.async_load()
+        restored_data = await self._sensor_values_store.async_load()
         if restored_data:
             self._data.update(restored_data)
             self.device_info.update({
@@ -768,7 +879,8 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
                 "hardware_version": restored_data.get("hardware_version"),
                 "software_version": restored_data.get("software_version"),
             })
-            self.async_set_updated_data(self._data.copy())
+            self._shared_device_info = None
+            self.async_set_updated_data(self._data)
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
@@ -777,109 +889,131 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
         # First restore any saved data
         await self._restore_persistent_data()
 
+        # Write pending changes at most every 30 seconds, and before Home Assistant stops
+        self._unsub_save_timer = async_track_time_interval(
+            self.hass, self._async_save_tick, timedelta(seconds=self._save_min_interval)
+        )
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
         # Now initialize any missing values to 0
         for key in self._daily_sensors + self._persistent_sensors:
             if self._data[key] is None:
                 self._data[key] = 0.0
                 _LOGGER.debug("Initialized missing value %s to 0", key)
+        self._fully_initialized = True
 
-        _LOGGER.debug("Coordinator setup complete with data: %s",
-                     {key: self._data[key] for key in self._daily_sensors + self._persistent_sensors})
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Coordinator setup complete with data: %s",
+                         {key: self._data[key] for key in self._daily_sensors + self._persistent_sensors})
 
     async def _add_missing_sensors(self):
         """Add missing sensors dynamically."""
-        entities = []
-        for char_name, info_key in [
-            ("Model Number", "model"),
-            ("Serial Number", "serial_number"),
-            ("Firmware Version", "firmware_version"),
-            ("Hardware Version", "hardware_version"),
-            ("Software Version", "software_version"),
-        ]:
-            if info_key in self.device_info and self.device_info[info_key]:
-                entities.append(
-                    DeskBikeDiagnosticSensor(
-                        self,
-                        self._config_entry,
-                        char_name,
-                        self.device_info[info_key]
-                    )
-                )
+        # Before the sensor platform is set up, async_setup_entry adds whatever is known by then
+        if self.async_add_entities is None:
+            return
+        entities = _build_diagnostic_entities(self, self._config_entry, self.device_info)
         if entities:
-            async_add_entities = self.hass.data[DOMAIN][self._config_entry.entry_id].async_add_entities
-            async_add_entities(entities)
+            self.async_add_entities(entities)
 
     async def _async_connect(self) -> None:
         """Connect to the DeskBike device."""
-        now = dt_util.utcnow()
+        if self._connected:
+            return
+
+        now = time.monotonic()
 
         # Check if we should attempt reconnection
         if not self._force_reconnect and (
-            self._last_connection_attempt and
+            self._last_connection_attempt is not None and
             now - self._last_connection_attempt < self._retry_interval
         ):
             return
 
         self._last_connection_attempt = now
         self._force_reconnect = False  # Reset the flag
-
-        if self._connected:
-            return
+        self._connection_attempts += 1  # Only attempts that actually run count
 
         async with self._connection_lock:
+            # Another caller may have connected while we waited for the lock
             if self._connected:
                 return
 
             try:
                 if self._client:
-                    try:
-                        await asyncio.wait_for(self._client.disconnect(), timeout=2.0)
-                    except (Exception, asyncio.TimeoutError):
-                        pass
+                    with contextlib.suppress(Exception):
+                        async with asyncio.timeout(2.0):
+                            await self._client.disconnect()
                     self._client = None
 
-                self._client = BleakClient(
-                    self.address,
+                ble_device = async_ble_device_from_address(self.hass, self.address, connectable=True)
+                if ble_device is None:
+                    raise BleakNotFoundError(f"DeskBike {self.address} is not in range")
+
+                # establish_connection retries transient GATT errors with backoff
+                # The service cache keeps GATT discovery results across reconnects
+                self._client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    self.name,
                     disconnected_callback=self._handle_disconnection,
-                    timeout=5.0
+                    max_attempts=3,
                 )
-
-                await asyncio.wait_for(self._client.connect(), timeout=5.0)
                 self._connected = True
+
+                # Resolve characteristic handles once so reads skip the UUID lookup
+                self._chars = {
+                    char.uuid: char
+                    for service in self._client.services
+                    for char in service.characteristics
+                }
                 self._data["is_connected"] = True
 
                 # Read device info and subscribe to notifications
                 try:
-                    battery_read = await asyncio.wait_for(
-                        self._client.read_gatt_char(CHAR_BATTERY),
-                        timeout=3.0
-                    )
-                    self._data["battery"] = int.from_bytes(battery_read, byteorder='little')
+                    async with asyncio.timeout(3.0):
+                        battery_read = await self._client.read_gatt_char(self._char(CHAR_BATTERY))
+                    self._data["battery"] = battery_read[0] if battery_read else 0
                 except (Exception, asyncio.TimeoutError) as e:
                     _LOGGER.debug("Error reading battery level: %s", e)
 
-                if not self.device_info:
+                if (
+                    self._device_info_read_at is None
+                    or dt_util.utcnow() - self._device_info_read_at > _DEVICE_INFO_TTL
+                ):
                     await self._read_device_info()
 
-                await asyncio.wait_for(
-                    self._client.start_notify(
-                        CHAR_CSC_MEASUREMENT,
+                async with asyncio.timeout(3.0):
+                    await self._client.start_notify(
+                        self._char(CHAR_CSC_MEASUREMENT),
                         self._notification_handler,
-                    ),
-                    timeout=3.0
-                )
+                    )
 
+                self._connection_attempts = 0
                 _LOGGER.debug("Connected to DeskBike")
                 return
 
             except Exception as e:
+                if self._client is not None:
+                    # Drop the connection and a possibly stale service cache before the next attempt
+                    with contextlib.suppress(Exception):
+                        await self._client.clear_cache()
+                    with contextlib.suppress(Exception):
+                        async with asyncio.timeout(2.0):
+                            await self._client.disconnect()
                 self._cleanup_connection()
                 raise
 
+    def _char(self, uuid: str):
+        """Return the cached characteristic for a UUID, or the UUID if not resolved."""
+        return self._chars.get(uuid, uuid)
+
     def _cleanup_connection(self) -> None:
         """Clean up the connection state."""
         self._connected = False
         self._data["is_connected"] = False
+        self._chars = {}
         if self._client:
             self._client = None
 
@@ -888,11 +1022,13 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
         self._connected = False
         self._data["is_connected"] = False
         self._data["is_active"] = False
-        self.async_set_updated_data(self._data.copy())
+        self.async_set_updated_data(self._data)
 
-        # Only schedule reconnection if we have recent activity
-        if (self._last_activity_time and
-            (dt_util.utcnow() - self._last_activity_time) < self._activity_timeout):
+        # Only schedule reconnection if we have recent activity and are not shutting down,
+        # an explicit disconnect during shutdown also ends up here
+        if (not self._shutting_down and
+            self._last_activity_time is not None and
+            time.monotonic() - self._last_activity_time < self._activity_timeout):
             if self._reconnect_task is None or self._reconnect_task.done():
                 self._reconnect_task = asyncio.create_task(self._async_handle_reconnect())
 
@@ -903,51 +1039,65 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_handle_reconnect(self) -> None:
         """Handle reconnection attempts."""
-        while not self._connected:
+        for delay in _RECONNECT_BACKOFF:
+            if delay:
+                await asyncio.sleep(delay)  # Wait before next attempt
+            if self._connected:
+                return
             try:
                 _LOGGER.debug("Attempting to reconnect to DeskBike...")
+                # Skip the retry interval, the backoff below spaces the attempts
+                self._force_reconnect = True
                 await self._async_connect()
-                if self._connected:
-                    _LOGGER.debug("Successfully reconnected to DeskBike")
-                    break
             except Exception as e:
                 _LOGGER.debug("Reconnection attempt failed: %s", e)
-                await asyncio.sleep(5)  # Wait before next attempt
+            if self._connected:
+                _LOGGER.debug("Successfully reconnected to DeskBike")
+                return
+
+        # These attempts bypassed the cap, give the coordinator refresh its own attempts again
+        self._connection_attempts = 0
+        _LOGGER.debug("Giving up reconnecting, the next coordinator refresh will retry")
+
+    async def _read_char(self, char_uuid: str) -> bytearray:
+        """Read a characteristic with a timeout."""
+        async with asyncio.timeout(3.0):
+            return await self._client.read_gatt_char(self._char(char_uuid))
+
+    async def _read_chars(self, char_uuids) -> list[bytearray | None]:
+        """Read several characteristics, with None for each read that failed."""
+        # The reads are independent, so issue them together instead of one round trip each
+        values = await asyncio.gather(
+            *(self._read_char(char_uuid) for char_uuid in char_uuids),
+            return_exceptions=True,
+        )
+        for char_uuid, value in zip(char_uuids, values):
+            if isinstance(value, BaseException):
+                _LOGGER.debug("Error reading characteristic %s: %s", char_uuid, value)
+        return [None if isinstance(value, BaseException) else value for value in values]
 
     async def _read_device_info(self) -> None:
         """Read device information characteristics with timeouts."""
+        device_chars = [(CHAR_DEVICE_NAME, "name")] + [
+            (char_uuid, key) for char_uuid, key, _ in _DEVICE_INFO_CHARS
+        ]
+        failed = True
         try:
-            for char_uuid in [
-                CHAR_PRODUCT_NAME,
-                CHAR_DEVICE_NAME,
-                CHAR_MODEL_NUMBER,
-                CHAR_SERIAL_NUMBER,
-                CHAR_FIRMWARE,
-                CHAR_HARDWARE,
-                CHAR_SOFTWARE,
-            ]:
-                try:
-                    value = await asyncio.wait_for(
-                        self._client.read_gatt_char(char_uuid),
-                        timeout=3.0
-                    )
-                    value_str = value.decode('utf-8').strip()
-                    if char_uuid == CHAR_MODEL_NUMBER:
-                        self.device_info["model"] = value_str
-                    elif char_uuid == CHAR_SERIAL_NUMBER:
-                        self.device_info["serial_number"] = value_str
-                    elif char_uuid == CHAR_FIRMWARE:
-                        self.device_info["firmware_version"] = value_str
-                    elif char_uuid == CHAR_HARDWARE:
-                        self.device_info["hardware_version"] = value_str
-                    elif char_uuid == CHAR_SOFTWARE:
-                        self.device_info["software_version"] = value_str
-                    elif char_uuid in [CHAR_PRODUCT_NAME, CHAR_DEVICE_NAME]:
-                        self.device_info["name"] = value_str
-                except (Exception, asyncio.TimeoutError) as e:
-                    _LOGGER.debug("Error reading characteristic %s: %s", char_uuid, e)
+            values = await self._read_chars([char_uuid for char_uuid, _ in device_chars])
+            failed = None in values
+            for (_, key), value in zip(device_chars, values):
+                if value is not None:
+                    self.device_info[key] = value.decode('utf-8').strip()
         except Exception as e:
             _LOGGER.debug("Failed to read device info: %s", e)
+        self._shared_device_info = None
+
+        # Only a complete read is cached, otherwise try again on the next connect
+        if not failed:
+            self._device_info_read_at = dt_util.utcnow()
+            self._save_pending = True
+
+        await self._add_missing_sensors()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data from DeskBike."""
@@ -957,24 +1107,42 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
                     await self._async_connect()
                 except Exception as connect_error:
                     _LOGGER.debug("Connection attempt failed: %s", connect_error)
-                    return self._data
-
-            # Save persistent data periodically
-            now = dt_util.utcnow()
-            if not hasattr(self, '_last_save') or (now - self._last_save > timedelta(minutes=5)):
-                await self._save_persistent_data()
-                self._last_save = now
 
             return self._data
         except Exception as error:
             _LOGGER.debug("Error fetching DeskBike data: %s", error)
             return self._data
 
+    async def _async_save_tick(self, now: datetime) -> None:
+        """Save pending changes, and persistent data periodically."""
+        # Also reset the daily values at midnight when the bike is not in use
+        if self._check_daily_reset(dt_util.as_local(now)):
+            self.async_set_updated_data(self._data)
+
+        # Runs on its own timer, async_set_updated_data postpones the coordinator
+        # refresh on every notification while the bike is in use
+        if self._save_pending or (
+            self._last_save is None or time.monotonic() - self._last_save >= self._save_interval
+        ):
+            await self._async_flush_save()
+
+    async def _async_flush_save(self) -> None:
+        """Write persistent data and clear the pending flag."""
+        self._save_pending = False
+        self._last_save = time.monotonic()
+        await self._save_persistent_data()
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        """Flush pending changes when Home Assistant stops."""
+        self._unsub_stop = None
+        if self._save_pending:
+            await self._async_flush_save()
+
     async def _async_disconnect(self) -> None:
         """Disconnect from the DeskBike device."""
         if self._client and self._connected:
             try:
-                await self._client.stop_notify(CHAR_CSC_MEASUREMENT)
+                await self._client.stop_notify(self._char(CHAR_CSC_MEASUREMENT))
             except Exception as e:
                 _LOGGER.debug("Error stopping notifications: %s", e)
 
@@ -985,19 +1153,38 @@ class DeskBikeDataUpdateCoordinator(DataUpdateCoordinator):
             finally:
                 self._connected = False
                 self._data["is_connected"] = False
+                self._chars = {}
                 self._client = None
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
-        if self._reconnect_task and not self._reconnect_task.done():
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
+        self._shutting_down = True
+        if self._unsub_save_timer:
+            self._unsub_save_timer()
+            self._unsub_save_timer = None
+        if self._unsub_stop:
+            self._unsub_stop()
+            self._unsub_stop = None
+
+        if self._update_handle is not None:
+            self._update_handle.cancel()
+            self._update_handle = None
+
+        # Let the cancelled tasks finish while the pending save is written
+        await self._async_cancel_tasks(self._async_flush_save() if self._save_pending else None)
         await self._async_disconnect()
+        # The disconnect callback must not have left a task behind, cancel anything that slipped in
+        await self._async_cancel_tasks()
         await super().async_shutdown()
 
+    async def _async_cancel_tasks(self, *others) -> None:
+        """Cancel the reconnect and reload tasks and wait for them, along with other awaitables."""
+        tasks = [task for task in (self._reconnect_task, self._reload_task) if task and not task.done()]
+        for task in tasks:
+            task.cancel()
+        # return_exceptions collects their CancelledError instead of raising it
+        await asyncio.gather(*tasks, *(other for other in others if other is not None), return_exceptions=True)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -1013,31 +1200,10 @@ async def async_setup_entry(
         entities.append(DeskBikeSensor(coordinator, entry, description))
 
     # Add diagnostic sensors if available
-    device_info = coordinator.device_info
-    if device_info:
-        for char_name, info_key in [
-            ("Model Number", "model"),
-            ("Serial Number", "serial_number"),
-            ("Firmware Version", "firmware_version"),
-            ("Hardware Version", "hardware_version"),
-            ("Software Version", "software_version"),
-        ]:
-            if info_key in device_info and device_info[info_key]:
-                entities.append(
-                    DeskBikeDiagnosticSensor(
-                        coordinator,
-                        entry,
-                        char_name,
-                        device_info[info_key]
-                    )
-                )
+    entities.extend(_build_diagnostic_entities(coordinator, entry, coordinator.device_info))
 
     async_add_entities(entities)
 
-    # Store coordinator in hass.data for cleanup
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-
     # Ensure missing sensors are added dynamically
-    coordinator.hass = hass
     coordinator._config_entry = entry
     coordinator.async_add_entities = async_add_entities